@@ -1,103 +1,445 @@
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import json
+import multiprocessing
+import re
+import shutil
 import subprocess
+import sys
 import tempfile
+import threading
 import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import webbrowser
 
-def findSilences(filename, dB=-35):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Above this many kept segments the per-frame select expression gets expensive,
+# so the concat demuxer is used to read only the kept ranges instead.
+CONCAT_SEGMENT_THRESHOLD = 100
+
+# The concat demuxer starts each segment at the keyframe before its inpoint and
+# passes on everything from there, so it only cuts cleanly when every frame is a
+# keyframe. Other codecs always take the frame-accurate select path.
+INTRA_ONLY_CODECS = {"mjpeg", "prores", "dnxhd", "huffyuv", "utvideo", "rawvideo", "v210", "png", "jpeg2000"}
+
+# Below this many silence timestamps the plain loop is faster than NumPy's setup cost.
+NUMPY_MIN_SILENCES = 1000
+
+# h264_nvenc only takes 8-bit 4:2:0 frames from CUDA memory; anything else has to be
+# decoded to host memory so ffmpeg can convert it before encoding.
+GPU_FRAME_PIXEL_FORMATS = {"yuv420p", "yuvj420p", "nv12"}
+
+# Re-encoded audio follows the bitrate of a lossy source, kept within this range.
+# Lossless and PCM sources leave the bitrate to the encoder's default.
+LOSSY_AUDIO_CODECS = {"aac", "mp3", "mp2", "ac3", "eac3", "opus", "vorbis", "wmav1", "wmav2"}
+MIN_AUDIO_BITRATE = 128000
+MAX_AUDIO_BITRATE = 320000
+
+# NVENC has its own p1-p7 preset scale; pin a balanced preset with constant-quality
+# VBR, lookahead and spatial AQ rather than relying on the encoder's defaults.
+NVENC_ARGS = ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23", "-b:v", "0",
+              "-rc-lookahead", "20", "-spatial-aq", "1"]
+
+# ffmpeg before 7.0 prints these with %g, so small values can come in exponent form.
+SILENCE_PATTERN = re.compile(rb"silence_(?:start|end): (-?[\d.]+(?:e[-+]?\d+)?)")
+
+# Shortest quiet stretch that counts as a silence, in seconds.
+SILENCE_MIN_DURATION = 0.5
+
+# Rumble and DC offset below this frequency (Hz) are filtered out before detection,
+# so they don't break up silences and leave extra short segments.
+HIGHPASS_HZ = 80
+
+# The NumPy detector takes the peak level of 10 ms windows of 8 kHz mono audio, the
+# same every-sample-below-threshold test silencedetect applies. Clips shorter than
+# PEAK_MIN_DURATION seconds go straight to ffmpeg's silencedetect.
+PEAK_SAMPLE_RATE = 8000
+PEAK_WINDOW = 80
+PEAK_MIN_DURATION = 60
+
+# Set by the GUI while processing runs on a worker thread, since Tk may only be
+# touched from the main thread.
+errorHandler = None
+
+def reportError(message):
+    if errorHandler:
+        errorHandler(message)
+    else:
+        messagebox.showerror("Error", message)
+
+def findSilences(filename, dB=-35, duration=0, progress=None, threads=0):
+    if np is not None and duration >= PEAK_MIN_DURATION:
+        return findSilences_peak(filename, dB, duration, progress, threads)
+    return findSilences_silencedetect(filename, dB, duration, progress, threads)
+
+def findSilences_peak(filename, dB=-35, duration=0, progress=None, threads=0):
+    command = ["ffmpeg", "-nostats", "-loglevel", "error", "-threads", str(threads), "-i", filename,
+               "-vn", "-map", "0:a:0", "-ac", "1", "-ar", str(PEAK_SAMPLE_RATE),
+               "-af", "highpass=f=" + str(HIGHPASS_HZ) + ",aresample=async=1:first_pts=0",
+               "-threads", str(threads), "-f", "s16le", "-"]
+    # Raw samples carry no timestamps, so aresample pads any leading offset and gaps
+    # with silence to keep sample positions in step with the input's timeline.
+    windowBytes = PEAK_WINDOW * 2
+    peaks = []
+    samplesRead = 0
     try:
-        command = ["ffmpeg", "-i", filename, "-af", "silencedetect=n=" + str(dB) + "dB:d=0.5", "-f", "null", "-"]
-        output = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        # Only the peak of each window is kept, so memory stays small for long recordings.
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as process:
+            pending = b""
+            while chunk := process.stdout.read(windowBytes * 1000):
+                pending += chunk
+                usable = len(pending) - len(pending) % windowBytes
+                samples = np.frombuffer(pending[:usable], dtype="<i2").astype(np.float32)
+                pending = pending[usable:]
+                peaks.append(np.abs(samples.reshape(-1, PEAK_WINDOW)).max(axis=1))
+                samplesRead += len(samples)
+                if progress and duration > 0:
+                    progress("Detecting silences", min(100.0, samplesRead / PEAK_SAMPLE_RATE * 100 / duration))
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command)
     except subprocess.CalledProcessError as e:
-        messagebox.showerror("Error", f"An error occurred while finding silences: {e}")
+        reportError(f"An error occurred while finding silences: {e}")
+        return None
+    if not peaks:
         return []
 
-    s = str(output)
-    lines = s.split("\\r")
+    quiet = np.concatenate(peaks) < 10 ** (dB / 20) * 32768
+    edges = np.diff(np.concatenate(([0], quiet.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    windowSeconds = PEAK_WINDOW / PEAK_SAMPLE_RATE
+    longEnough = (ends - starts) * windowSeconds >= SILENCE_MIN_DURATION
+    return (np.column_stack((starts[longEnough], ends[longEnough])).ravel() * windowSeconds).tolist()
+
+def findSilences_silencedetect(filename, dB=-35, duration=0, progress=None, threads=0):
+    command = ["ffmpeg", "-nostats", "-loglevel", "info", "-progress", "pipe:2",
+               "-threads", str(threads), "-i", filename,
+               "-vn", "-map", "0:a:0", "-ac", "1", "-ar", "16000",
+               "-af", "highpass=f=" + str(HIGHPASS_HZ) + ",silencedetect=n=" + str(dB) + "dB:d=" + str(SILENCE_MIN_DURATION),
+               "-threads", str(threads), "-f", "null", "-"]
     time_list = []
-    for line in lines:
-        if "silencedetect" in line:
-            words = line.split(" ")
-            for i in range(len(words)):
-                if "silence_start" in words[i]:
-                    time_list.append(float(words[i + 1]))
-                if "silence_end" in words[i]:
-                    time_list.append(float(words[i + 1]))
+    try:
+        # Parse ffmpeg's stderr as it is produced instead of buffering the whole decode pass.
+        # Starts and ends arrive in order, so one pattern yields the interleaved list directly.
+        with subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as process:
+            for line in process.stderr:
+                if match := SILENCE_PATTERN.search(line):
+                    time_list.append(float(match.group(1)))
+                elif progress and duration > 0 and line.startswith(b"out_time_us="):
+                    value = line[len(b"out_time_us="):].strip()
+                    if value.isdigit():
+                        progress("Detecting silences", min(100.0, int(value) / 10000 / duration))
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command)
+    except subprocess.CalledProcessError as e:
+        reportError(f"An error occurred while finding silences: {e}")
+        return None
     return time_list
 
-def getVideoDuration(filename):
+@functools.lru_cache(maxsize=32)
+def probeMediaCached(path, mtime):
+    # Everything the cutter needs about a file comes from this one ffprobe call.
+    command = ["ffprobe", "-v", "quiet", "-hide_banner", "-of", "json",
+               "-show_entries", "format=duration:stream=codec_type,codec_name,pix_fmt,r_frame_rate,bit_rate", path]
+    output = subprocess.run(command, stdout=subprocess.PIPE, check=True).stdout
+    return orjson.loads(output) if orjson else json.loads(output)
+
+def probeMedia(filename):
+    # Keyed on the modification time so an edited file is probed again.
+    path = os.path.realpath(filename)
+    return probeMediaCached(path, os.path.getmtime(path))
+
+def getFirstStream(info, codecType):
+    for stream in info.get("streams", []):
+        if stream.get("codec_type") == codecType:
+            return stream
+    return {}
+
+def getVideoDuration(info):
     try:
-        command = ["ffprobe", "-i", filename, "-v", "quiet", "-show_entries", "format=duration", "-hide_banner", "-of", "default=noprint_wrappers=1:nokey=1"]
-        output = subprocess.run(command, stdout=subprocess.PIPE, check=True)
-    except subprocess.CalledProcessError as e:
-        messagebox.showerror("Error", f"An error occurred while getting video duration: {e}")
+        return float(info["format"]["duration"])
+    except (KeyError, ValueError):
         return 0
 
-    s = str(output.stdout, "UTF-8")
-    return float(s)
+def getVideoCodec(info):
+    return getFirstStream(info, "video").get("codec_name", "")
+
+def getVideoPixelFormat(info):
+    return getFirstStream(info, "video").get("pix_fmt", "")
+
+def getVideoFrameRate(info):
+    s = getFirstStream(info, "video").get("r_frame_rate", "")
+    numerator, _, denominator = s.partition("/")
+    try:
+        return float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0
 
-def getSectionsOfNewVideo(silences, duration):
-    return [0.0] + silences + [duration]
+def getAudioInfo(info):
+    stream = getFirstStream(info, "audio")
+    bitRate = int(stream["bit_rate"]) if stream.get("bit_rate", "").isdigit() else 0
+    return stream.get("codec_name", ""), bitRate
+
+def getSectionsOfNewVideo(silences, duration, fps=0):
+    # Gaps and segments no longer than one frame can't be seen in the output,
+    # so fold them away to keep the filter expression short.
+    frame = 1 / fps if fps > 0 else 0.0
+    timings = [0.0] + silences + [duration]
+    if np is not None and len(silences) >= NUMPY_MIN_SILENCES:
+        return getSectionsOfNewVideo_vectorized(timings, frame)
+    merged = []
+    for i in range(int(len(timings) / 2)):
+        start = timings[2 * i]
+        end = timings[2 * i + 1]
+        if merged and start - merged[-1] <= frame:
+            merged[-1] = end
+        else:
+            merged += [start, end]
+    ret = []
+    for i in range(int(len(merged) / 2)):
+        if merged[2 * i + 1] - merged[2 * i] > frame:
+            ret += [merged[2 * i], merged[2 * i + 1]]
+    return ret
+
+def getSectionsOfNewVideo_vectorized(timings, frame):
+    count = int(len(timings) / 2)
+    t = np.asarray(timings[:2 * count], dtype=np.float64)
+    starts = t[0::2]
+    ends = t[1::2]
+    newGroup = np.empty(count, dtype=bool)
+    newGroup[0] = True
+    newGroup[1:] = starts[1:] - ends[:-1] > frame
+    groupStarts = starts[newGroup]
+    groupEnds = ends[np.append(newGroup[1:], True)]
+    keep = groupEnds - groupStarts > frame
+    return np.column_stack((groupStarts[keep], groupEnds[keep])).ravel().tolist()
 
 def ffmpeg_filter_getSegmentFilter(videoSectionTimings):
+    # Millisecond precision is finer than any frame and keeps the script small for ffmpeg to parse.
+    parts = [b"between(t,%.3f,%.3f)" % (videoSectionTimings[2 * i], videoSectionTimings[2 * i + 1])
+             for i in range(int(len(videoSectionTimings) / 2))]
+    return b"+".join(parts)
+
+def getFileContent_complexFilter(videoSectionTimings, hasVideo=True):
+    segmentFilter = ffmpeg_filter_getSegmentFilter(videoSectionTimings)
+    parts = [b"[0:a]aselect='", segmentFilter, b"', asetpts=N/SR/TB[a]"]
+    if hasVideo:
+        parts = [b"[0:v]select='", segmentFilter, b"', setpts=N/FRAME_RATE/TB[v];"] + parts
+    return b"".join(parts)
+
+def getFileContent_concatList(filename, videoSectionTimings):
+    path = os.path.abspath(filename).replace("'", "'\\''")
     ret = ""
     for i in range(int(len(videoSectionTimings) / 2)):
-        start = videoSectionTimings[2 * i]
-        end = videoSectionTimings[2 * i + 1]
-        ret += "between(t," + str(start) + "," + str(end) + ")+"
-    ret = ret[:-1]
+        ret += "file '" + path + "'\n"
+        ret += "inpoint " + str(videoSectionTimings[2 * i]) + "\n"
+        ret += "outpoint " + str(videoSectionTimings[2 * i + 1]) + "\n"
     return ret
 
-def getFileContent_videoFilter(videoSectionTimings):
-    ret = "select='"
-    ret += ffmpeg_filter_getSegmentFilter(videoSectionTimings)
-    ret += "', setpts=N/FRAME_RATE/TB"
-    return ret
+def writeFile(filename, content):
+    if isinstance(content, str):
+        content = content.encode("UTF-8")
+    with open(filename, "wb") as file:
+        file.write(content)
 
-def getFileContent_audioFilter(videoSectionTimings):
-    ret = "aselect='"
-    ret += ffmpeg_filter_getSegmentFilter(videoSectionTimings)
-    ret += "', asetpts=N/SR/TB"
-    return ret
+@contextlib.contextmanager
+def scriptFile(content, prefix):
+    if isinstance(content, str):
+        content = content.encode("UTF-8")
+    if os.name != "posix":
+        with tempfile.NamedTemporaryFile(mode="wb", prefix=prefix, delete=False) as file:
+            pass
+        writeFile(file.name, content)
+        try:
+            yield file.name, ()
+        finally:
+            os.unlink(file.name)
+        return
 
-def writeFile(filename, content):
-    with open(filename, "w") as file:
-        file.write(str(content))
+    # Hand the script to ffmpeg through an inherited pipe instead of a file on disk.
+    # A thread feeds it so scripts larger than the pipe buffer can't deadlock.
+    readFd, writeFd = os.pipe()
 
-def ffmpeg_run(file, videoFilter, audioFilter, outfile):
+    def feed():
+        try:
+            with open(writeFd, "wb") as pipe:
+                pipe.write(content)
+        except BrokenPipeError:
+            pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
     try:
-        with tempfile.NamedTemporaryFile(mode="w", encoding="UTF-8", prefix="silence_video", delete=False) as vFile, \
-             tempfile.NamedTemporaryFile(mode="w", encoding="UTF-8", prefix="silence_audio", delete=False) as aFile:
-            writeFile(vFile.name, videoFilter)
-            writeFile(aFile.name, audioFilter)
+        yield f"/dev/fd/{readFd}", (readFd,)
+    finally:
+        # Closing our read end unblocks the writer if ffmpeg exited without reading.
+        os.close(readFd)
+        writer.join()
 
-            command = ["ffmpeg", "-hwaccel", "cuda", "-i", file,
-                       "-filter_script:v", vFile.name,
-                       "-filter_script:a", aFile.name,
-                       "-c:v", "h264_nvenc", outfile]
+def ffmpeg_runWithProgress(command, passFds=(), outputDuration=0, progress=None):
+    # Progress comes as key=value lines on stdout; stderr only carries errors and is
+    # drained on the side, keeping just its tail for the error message.
+    errors = collections.deque(maxlen=20)
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, pass_fds=passFds) as process:
+        stderrReader = threading.Thread(target=errors.extend, args=(process.stderr,), daemon=True)
+        stderrReader.start()
+        for line in process.stdout:
+            if progress and outputDuration > 0 and line.startswith(b"out_time_us="):
+                value = line[len(b"out_time_us="):].strip()
+                if value.isdigit():
+                    progress("Encoding", min(100.0, int(value) / 10000 / outputDuration))
+        stderrReader.join()
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, stderr=b"".join(errors))
 
-            subprocess.run(command, check=True)
+def ffmpeg_run(file, complexFilter, outfile, threads=0, audioArgs=(), outputDuration=0, progress=None, hasVideo=True):
+    # Audio-only input has no [v] branch, so there is nothing to decode or encode on the GPU.
+    videoInputArgs = ["-hwaccel", "cuda"] if hasVideo else []
+    videoOutputArgs = ["-map", "[v]", *NVENC_ARGS] if hasVideo else []
+    try:
+        with scriptFile(complexFilter, "silence_filter") as (filterPath, passFds):
+            command = ["ffmpeg", "-y", "-nostats", "-loglevel", "error", "-progress", "pipe:1",
+                       *videoInputArgs, "-threads", str(threads), "-i", file,
+                       "-filter_complex_threads", str(threads), "-filter_complex_script", filterPath,
+                       *videoOutputArgs, "-map", "[a]",
+                       *audioArgs, "-threads", str(threads), outfile]
+
+            ffmpeg_runWithProgress(command, passFds, outputDuration, progress)
     except subprocess.CalledProcessError as e:
-        messagebox.showerror("Error", f"An error occurred while processing the file: {e}")
+        reportError(f"An error occurred while processing the file: {e}\n{e.stderr.decode(errors='replace')}")
 
-def cut_silences(infile, outfile, dB=-35):
-    silences = findSilences(infile, dB)
-    if not silences:
+def ffmpeg_runConcat(concatList, outfile, threads=0, audioArgs=(), outputDuration=0, progress=None, gpuFrames=False):
+    # Nothing filters the frames here, so when NVENC can take them directly they
+    # stay in GPU memory from NVDEC to NVENC.
+    hwaccelArgs = ["-hwaccel", "cuda"]
+    if gpuFrames:
+        hwaccelArgs += ["-hwaccel_output_format", "cuda", "-extra_hw_frames", "8"]
+    try:
+        with scriptFile(concatList, "silence_concat") as (listPath, passFds):
+            command = ["ffmpeg", "-y", "-nostats", "-loglevel", "error", "-progress", "pipe:1",
+                       *hwaccelArgs, "-threads", str(threads), "-f", "concat", "-safe", "0", "-i", listPath,
+                       *NVENC_ARGS, *audioArgs, "-threads", str(threads), outfile]
+
+            ffmpeg_runWithProgress(command, passFds, outputDuration, progress)
+    except subprocess.CalledProcessError as e:
+        reportError(f"An error occurred while processing the file: {e}\n{e.stderr.decode(errors='replace')}")
+
+def fastClone(src, dst):
+    # copy_file_range lets the kernel share extents (reflink) on filesystems that
+    # support it, and `cp -c` uses clonefile on macOS; both avoid rewriting the data.
+    try:
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            # Some filesystems refuse with 0 instead of an error; fall back to a plain copy.
+                            raise OSError("copy_file_range copied nothing")
+                        remaining -= copied
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                pass
+        if sys.platform == "darwin" and subprocess.run(["cp", "-c", src, dst]).returncode == 0:
+            return
+        shutil.copy2(src, dst)
+    except OSError as e:
+        reportError(f"An error occurred while copying the file: {e}")
+
+def cut_silences(infile, outfile, dB=-35, progress=None, threads=0):
+    try:
+        info = probeMedia(infile)
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        reportError(f"An error occurred while reading the media info: {e}")
         return
-    duration = getVideoDuration(infile)
+    duration = getVideoDuration(info)
     if duration == 0:
+        reportError(f"Could not determine the duration of {infile}.")
+        return
+    silences = findSilences(infile, dB, duration, progress, threads)
+    if silences is None:
+        return
+    if not silences and os.path.splitext(infile)[1].lower() == os.path.splitext(outfile)[1].lower():
+        fastClone(infile, outfile)
         return
-    videoSegments = getSectionsOfNewVideo(silences, duration)
-    videoFilter = getFileContent_videoFilter(videoSegments)
-    audioFilter = getFileContent_audioFilter(videoSegments)
-    ffmpeg_run(infile, videoFilter, audioFilter, outfile)
+    fps = getVideoFrameRate(info)
+    videoSegments = getSectionsOfNewVideo(silences, duration, fps)
+    if not videoSegments:
+        reportError(f"No non-silent audio found above {dB} dB in {infile}.")
+        return
+    outputDuration = sum(videoSegments[1::2]) - sum(videoSegments[0::2])
+    audioCodec, audioBitRate = getAudioInfo(info)
+    encodeAudioArgs = []
+    if audioCodec in LOSSY_AUDIO_CODECS and audioBitRate:
+        encodeAudioArgs = ["-b:a", str(min(max(audioBitRate, MIN_AUDIO_BITRATE), MAX_AUDIO_BITRATE))]
+    if len(videoSegments) / 2 > CONCAT_SEGMENT_THRESHOLD and getVideoCodec(info) in INTRA_ONLY_CODECS:
+        concatList = getFileContent_concatList(infile, videoSegments)
+        gpuFrames = getVideoPixelFormat(info) in GPU_FRAME_PIXEL_FORMATS
+        ffmpeg_runConcat(concatList, outfile, threads, encodeAudioArgs, outputDuration, progress, gpuFrames)
+    else:
+        hasVideo = bool(getFirstStream(info, "video"))
+        complexFilter = getFileContent_complexFilter(videoSegments, hasVideo)
+        ffmpeg_run(infile, complexFilter, outfile, threads, encodeAudioArgs, outputDuration, progress, hasVideo)
+
+def cut_silences_collectErrors(infile, outfile, dB=-35, progress=None, threads=0):
+    # Returns the errors instead of reporting them, so the caller can tell a failed
+    # run from a successful one.
+    global errorHandler
+    errors = []
+    previousHandler, errorHandler = errorHandler, errors.append
+    try:
+        cut_silences(infile, outfile, dB, progress, threads)
+    finally:
+        errorHandler = previousHandler
+    return errors
+
+def cut_silences_batchJob(infile, outfile, dB, threads):
+    # Runs in a pool worker: errors are handed back to the parent instead of
+    # opening a dialog inside the worker process.
+    return cut_silences_collectErrors(infile, outfile, dB, None, threads)
+
+def cut_silences_batch(jobs, dB=-35, maxParallel=None):
+    # Run several files side by side and split the cores between their ffmpeg processes.
+    # Returns the error messages of the jobs that failed, for the caller to report.
+    cpus = os.cpu_count() or 1
+    maxParallel = min(maxParallel or cpus, len(jobs))
+    if maxParallel < 1:
+        return []
+    threads = max(1, cpus // maxParallel)
+    failures = []
+    # Spawned rather than forked, so workers don't inherit the GUI's Tk state.
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(maxParallel, mp_context=context) as executor:
+        futures = {executor.submit(cut_silences_batchJob, infile, outfile, dB, threads): infile for infile, outfile in jobs}
+        for future, infile in futures.items():
+            try:
+                errors = future.result()
+            except Exception as e:
+                errors = [str(e)]
+            failures += [f"{os.path.basename(infile)}: {error}" for error in errors]
+    return failures
 
 class SilenceCutterApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Silence Cutter")
-        self.geometry("400x300")
+        self.geometry("400x360")
 
         self.infile_label = tk.Label(self, text="Input File:")
         self.infile_label.pack()
@@ -122,9 +464,22 @@ class SilenceCutterApp(tk.Tk):
         self.process_button = tk.Button(self, text="Process", command=self.process_file)
         self.process_button.pack()
 
+        self.batch_button = tk.Button(self, text="Batch Process", command=self.process_batch)
+        self.batch_button.pack()
+
+        self.status_label = tk.Label(self, text="")
+        self.status_label.pack()
+
         self.help_button = tk.Button(self, text="Help", command=self.show_help)
         self.help_button.pack()
 
+        # Worker threads only append here; the main loop applies the events to the widgets.
+        self.ui_events = collections.deque()
+        self.last_progress = None
+        global errorHandler
+        errorHandler = self.queue_error
+        self.after(50, self.drain_ui_events)
+
     def browse_file(self):
         filename = filedialog.askopenfilename(title="Select a file", filetypes=[("Media files", "*.*")])
         self.infile_entry.delete(0, tk.END)
@@ -152,10 +507,103 @@ class SilenceCutterApp(tk.Tk):
 
         try:
             db_value = float(db)
-            cut_silences(infile, outfile, db_value)
-            messagebox.showinfo("Success", "Processing completed.")
         except ValueError:
             messagebox.showerror("Error", "Invalid decibel level for silence threshold.")
+            return
+
+        def task():
+            errors = cut_silences_collectErrors(infile, outfile, db_value, self.queue_progress)
+            if errors:
+                return "\n".join(errors)
+
+        self.run_in_background(task, "Processing completed.")
+
+    def process_batch(self):
+        infiles = filedialog.askopenfilenames(title="Select files", filetypes=[("Media files", "*.*")])
+        if not infiles:
+            return
+        outdir = filedialog.askdirectory(title="Select output folder")
+        if not outdir:
+            return
+
+        jobs = []
+        for infile in infiles:
+            name, ext = os.path.splitext(os.path.basename(infile))
+            jobs.append((infile, os.path.join(outdir, name + "_cut" + ext)))
+
+        try:
+            db_value = float(self.db_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Invalid decibel level for silence threshold.")
+            return
+
+        # ffmpeg is told to overwrite (-y), so ask once here for the whole batch.
+        existing = [outfile for _, outfile in jobs if os.path.exists(outfile)]
+        if existing and not messagebox.askyesno(
+                "Overwrite files?",
+                f"{len(existing)} of the output files already exist in {outdir}. Overwrite them?"):
+            return
+
+        self.status_label.config(text=f"Processing {len(jobs)} files...")
+        def task():
+            failures = cut_silences_batch(jobs, db_value)
+            if failures:
+                return "Some files could not be processed:\n" + "\n".join(failures)
+
+        self.run_in_background(task, f"Processing of {len(jobs)} files completed.")
+
+    def run_in_background(self, task, success_message):
+        # A task may return an error message to report in place of the success message.
+        self.process_button.config(state=tk.DISABLED)
+        self.batch_button.config(state=tk.DISABLED)
+        self.last_progress = None
+
+        def work():
+            try:
+                failure = task()
+                if failure:
+                    self.ui_events.append(("failed", failure))
+                else:
+                    self.ui_events.append(("done", success_message))
+            except Exception as e:
+                self.ui_events.append(("failed", f"An error occurred while processing: {e}"))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def queue_progress(self, stage, percent):
+        # Called for every progress line ffmpeg writes; only format and queue a status
+        # when the whole-percent value shown in the label actually changes.
+        progress = (stage, round(percent))
+        if progress == self.last_progress:
+            return
+        self.last_progress = progress
+        self.ui_events.append(("progress", f"{stage}... {progress[1]}%"))
+
+    def queue_error(self, message):
+        self.ui_events.append(("error", message))
+
+    def drain_ui_events(self):
+        # Only the newest progress value is drawn, however many arrived since the last drain.
+        status = None
+        for _ in range(len(self.ui_events)):
+            kind, value = self.ui_events.popleft()
+            if kind == "progress":
+                status = value
+                continue
+            status = None
+            if kind == "error":
+                messagebox.showerror("Error", value)
+            else:
+                self.status_label.config(text="")
+                self.process_button.config(state=tk.NORMAL)
+                self.batch_button.config(state=tk.NORMAL)
+                if kind == "done":
+                    messagebox.showinfo("Success", value)
+                else:
+                    messagebox.showerror("Error", value)
+        if status is not None:
+            self.status_label.config(text=status)
+        self.after(50, self.drain_ui_events)
 
     def show_help(self):
         help_text = """
@@ -171,5 +619,6 @@ class SilenceCutterApp(tk.Tk):
         messagebox.showinfo("Help", help_text)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = SilenceCutterApp()
     app.mainloop()